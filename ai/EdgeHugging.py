@@ -1,7 +1,6 @@
 # ai/EdgeHugging.py
 from typing import Dict, List, Tuple, Optional
 from collections import deque
-import copy
 import random
 
 from engine.game_engine import GameEngine
@@ -41,39 +40,42 @@ class EdgeHugging(BaseAIPlayer):
         best_position = None
         best_score = -float('inf')
         
-        # Try placing the block at each position
-        for r in range(board.rows):
-            for c in range(board.cols):
-                if board.can_place(block, r, c):
-                    # Create a copy of the board and place the block
-                    tmp_board = copy.deepcopy(board)
-                    tmp_board.place_block(block, r, c)
-                    
-                    # Calculate edge score
-                    edge_score = self._calculate_edge_score(tmp_board)
-                    
-                    # Calculate compactness score
-                    compactness_score = self._calculate_compactness(tmp_board)
-                    
-                    # Calculate line clear score
-                    line_clear_cells = tmp_board.find_full_lines()
-                    line_clear_score = len(line_clear_cells) * 10  # High bonus for clearing lines
-                    
-                    # Calculate overall score (weighted)
-                    total_score = (
-                        edge_score * 1.5 +  # Edge score is important
-                        compactness_score * 1.0 +  # Compactness is good too 
-                        line_clear_score  # Line clearing is very valuable
-                    )
-                    
-                    # Add small random factor to break ties
-                    total_score += random.random() * 0.1
-                    
-                    # Update best position if this is better
-                    if total_score > best_score:
-                        best_score = total_score
-                        best_position = (r, c)
+        # One scratch board for every candidate: place, score, then take the block back out
+        tmp_board = board.copy()
+        cols = board.cols
+        block_mask = block.mask(cols)
         
+        # Try placing the block at each valid position
+        for r, c in board.valid_anchors(block):
+            tmp_board.place_block(block, r, c)
+            
+            # Calculate edge score
+            edge_score = self._calculate_edge_score(tmp_board)
+            
+            # Calculate compactness score
+            compactness_score = self._calculate_compactness(tmp_board)
+            
+            # Calculate line clear score
+            line_clear_score = tmp_board.count_full_line_cells() * 10  # High bonus for clearing lines
+            
+            # Calculate overall score (weighted)
+            total_score = (
+                edge_score * 1.5 +  # Edge score is important
+                compactness_score * 1.0 +  # Compactness is good too 
+                line_clear_score  # Line clearing is very valuable
+            )
+            
+            # Undo the placement; the anchor was free, so only the block's own cells are cleared
+            tmp_board.clear_mask(block_mask << (r * cols + c))
+            
+            # Add small random factor to break ties
+            total_score += random.random() * 0.1
+            
+            # Update best position if this is better
+            if total_score > best_score:
+                best_score = total_score
+                best_position = (r, c)
+
         return best_position
     
     def _calculate_edge_score(self, board: Board) -> float:
@@ -86,7 +88,7 @@ class EdgeHugging(BaseAIPlayer):
             Edge score (higher is better)
         """
         edge_score = 0
-        rows, cols = board.rows, board.cols
+        grid, rows, cols = board.grid, board.rows, board.cols
         
         # Count filled cells along the edges
         edge_cells = 0
@@ -94,16 +96,16 @@ class EdgeHugging(BaseAIPlayer):
         
         # Check left and right edges
         for r in range(rows):
-            if board.grid[r][0] == 1:  # Left edge
+            if grid[r][0] == 1:  # Left edge
                 edge_cells += 1
-            if board.grid[r][cols-1] == 1:  # Right edge
+            if grid[r][cols-1] == 1:  # Right edge
                 edge_cells += 1
                 
         # Check top and bottom edges (excluding corners which were already counted)
         for c in range(1, cols-1):
-            if board.grid[0][c] == 1:  # Top edge
+            if grid[0][c] == 1:  # Top edge
                 edge_cells += 1
-            if board.grid[rows-1][c] == 1:  # Bottom edge
+            if grid[rows-1][c] == 1:  # Bottom edge
                 edge_cells += 1
         
         # Calculate edge occupancy score
@@ -125,18 +127,20 @@ class EdgeHugging(BaseAIPlayer):
         
         # Count the number of adjacent filled cell pairs
         adjacent_count = 0
-        for r in range(board.rows):
-            for c in range(board.cols):
-                if board.grid[r][c] == 1:
+        grid, rows, cols = board.grid, board.rows, board.cols
+        for r in range(rows):
+            row = grid[r]
+            for c in range(cols):
+                if row[c] == 1:
                     # Check right neighbor
-                    if c + 1 < board.cols and board.grid[r][c+1] == 1:
+                    if c + 1 < cols and row[c+1] == 1:
                         adjacent_count += 1
                     # Check bottom neighbor
-                    if r + 1 < board.rows and board.grid[r+1][c] == 1:
+                    if r + 1 < rows and grid[r+1][c] == 1:
                         adjacent_count += 1
         
         # Calculate compactness as ratio of adjacent pairs to filled cells
-        max_adjacent = 2 * filled_cells - board.rows - board.cols
+        max_adjacent = 2 * filled_cells - rows - cols
         compactness = adjacent_count / max_adjacent if max_adjacent > 0 else 0
         
         return compactness * 100  # Scale to a larger range 
\ No newline at end of file
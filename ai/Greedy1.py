@@ -1,6 +1,5 @@
 # ai/Greedy1.py
 from typing import Tuple, Optional
-import copy
 
 from engine.game_engine import GameEngine
 from engine.board import Board
@@ -38,30 +37,21 @@ class Greedy1(BaseAIPlayer):
         best_position = None
         best_score = -1
         
-        # Try each possible position
-        for r in range(board.rows):
-            for c in range(board.cols):
-                if board.can_place(block, r, c):
-                    # Create a temporary board
-                    tmp_board = copy.deepcopy(board)
-                    
-                    # Place the block
-                    tmp_board.place_block(block, r, c)
-                    
-                    # Count the number of lines that would be cleared
-                    clear_cells = tmp_board.find_full_lines()
-                    score = len(clear_cells)
-                    
-                    # Choose the placement that clears the most cells
-                    if score > best_score:
-                        best_score = score
-                        best_position = (r, c)
-                    # If scores are tied, prefer upper rows and leftmost columns
-                    elif score == best_score and best_position is not None:
-                        best_r, best_c = best_position
-                        if r < best_r or (r == best_r and c < best_c):
-                            best_position = (r, c)
-        
+        # Try each valid position
+        for r, c in board.valid_anchors(block):
+            # Count the cells the placement would clear, straight from the bitboard
+            score = board.cells_cleared_by(block, r, c)
+            
+            # Choose the placement that clears the most cells
+            if score > best_score:
+                best_score = score
+                best_position = (r, c)
+            # If scores are tied, prefer upper rows and leftmost columns
+            elif score == best_score and best_position is not None:
+                best_r, best_c = best_position
+                if r < best_r or (r == best_r and c < best_c):
+                    best_position = (r, c)
+
         return best_position
 
 
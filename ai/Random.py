@@ -27,11 +27,12 @@ class Random(BaseAIPlayer):
         Returns:
             Tuple of (row, col) for random valid placement or None if no valid placement
         """
-        # Get all valid placements for this block
-        valid_placements = engine.get_valid_placements(block_index)
+        # Get all valid placements for this block as a bitmap
+        valid_mask = engine.get_valid_placement_mask(block_index)
         
-        if not valid_placements:
+        if not valid_mask:
             return None
             
-        # Choose a random placement
-        return random.choice(list(valid_placements)) 
\ No newline at end of file
+        # Choose a random placement among the set bits
+        anchors = [bit for bit in range(valid_mask.bit_length()) if valid_mask >> bit & 1]
+        return divmod(random.choice(anchors), engine.board.cols)
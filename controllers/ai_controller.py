@@ -63,16 +63,20 @@ class AIController(BaseController):
             return False
             
         # Update metrics to compute current best-fit block
-        # Game state metrics are refreshed elsewhere; update best-fit based on board state
-        self.engine.metrics_manager.update_block_metrics(self.engine.board)
+        # Game state metrics are refreshed elsewhere; the best-fit scan is redone only when
+        # the board changed since the last one (a tray refill already scanned it)
+        self.engine.refresh_block_metrics()
         # Auto-select the best-fit block in the preview if available
         metrics = self.engine.get_metrics()
         best_name = metrics.get("best_fit_block")
         if best_name and "shapes" in self.config:
+            # Block cells are stored as a tuple of (row, col) tuples
+            best_shape = self.config["shapes"].get(best_name)
+            best_cells = tuple(map(tuple, best_shape)) if best_shape else None
             # Find index of block matching best-fit shape
             for idx, block in enumerate(self.engine.get_preview_blocks()):
                 # Compare block cells to shape definition
-                if block.cells == self.config["shapes"].get(best_name):
+                if block.cells == best_cells:
                     self.select_block(idx)
                     break
         # Get the current selected preview index
@@ -1,10 +1,13 @@
 # controllers/base_controller.py
+import logging
 from typing import Dict, Optional, Tuple, Any
 
 from engine.game_engine import GameEngine
 from utils.config_manager import config_manager
 from utils.event_manager import EventManager
 
+logger = logging.getLogger(__name__)
+
 
 class BaseController:
     """Base controller interface that all game controllers should implement.
@@ -94,7 +97,7 @@ class BaseController:
             return False
             
         # Update config through the config manager (which will notify observers)
-        print(f"[controllers/base_controller.py][97] Updating config")
+        logger.debug("Updating config (%d fields)", len(new_config))
         config_manager.update(new_config)
         
         return True
@@ -13,6 +13,38 @@ from ui.layout import WINDOW_WIDTH, WINDOW_HEIGHT
 
 from utils.window_metrics import outer_from_client 
 
+# Process-wide setup (DPI awareness, pygame.init) only needs to happen once
+_display_ready = False
+
+
+def _init_display_once() -> None:
+    """Make the process DPI-aware (Windows only) and initialise pygame, once per process."""
+    global _display_ready
+    if _display_ready:
+        return
+    
+    # --- Make process DPI-aware so we work in raw pixels (Windows only) ---
+    if sys.platform == "win32":
+        try:
+            ctypes.windll.shcore.SetProcessDpiAwareness(1)   # PER_MONITOR_DPI_AWARE
+        except AttributeError:
+            pass
+
+    # Initialize pygame
+    pygame.init()
+    
+    # Hover effects poll the mouse, so keep MOUSEMOTION bursts off the event queue
+    pygame.event.set_blocked(pygame.MOUSEMOTION)
+    _display_ready = True
+
+
+def _shutdown_display() -> None:
+    """Quit pygame; the next controller will initialise it again."""
+    global _display_ready
+    pygame.quit()
+    _display_ready = False
+
+
 class GameController(BaseController):
     """Controller for handling Pygame UI and game interactions."""
     
@@ -20,15 +52,8 @@ class GameController(BaseController):
         # Initialize base controller
         super().__init__(config)
         
-        # --- Make process DPI-aware so we work in raw pixels (Windows only) ---
-        if sys.platform == "win32":
-            try:
-                ctypes.windll.shcore.SetProcessDpiAwareness(1)   # PER_MONITOR_DPI_AWARE
-            except AttributeError:
-                pass
-
-        # Initialize pygame
-        pygame.init()
+        # DPI awareness and pygame.init run only for the first controller in the process
+        _init_display_once()
         
         # ------------------------------------------------------------------
         # Initialize window with the defined window size constants
@@ -54,6 +79,23 @@ class GameController(BaseController):
         
         # Update sidebar fields from config
         self.main_view.update_config_fields(self.config)
+        
+        # Dispatch tables for UI actions and key presses (one lookup per event)
+        self.action_handlers = {
+            "apply": lambda ui_action: self.apply_config_changes(),
+            "restart": lambda ui_action: self.restart_game(),
+            "select_block": lambda ui_action: self.handle_preview_click(ui_action.get("index")),
+            "place_block": lambda ui_action: self.handle_board_click(ui_action.get("position")),
+        }
+        self.key_handlers = {
+            pygame.K_F2: self.restart_game,
+            pygame.K_RETURN: self._restart_if_game_over,
+        }
+    
+    def _restart_if_game_over(self) -> None:
+        """Restart when Enter is pressed on the game over screen."""
+        if self.engine.game_over:
+            self.restart_game()
     
     def apply_config_changes(self) -> bool:
         """Apply changes from the sidebar config inputs."""
@@ -93,6 +135,8 @@ class GameController(BaseController):
     
     def _handle_core_events(self) -> bool:
         """Process core user input events. Protected method for reuse by subclasses."""
+        action_handlers = self.action_handlers
+        key_handlers = self.key_handlers
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 return False
@@ -108,23 +152,22 @@ class GameController(BaseController):
             # Handle UI events via main_view
             ui_action = self.main_view.handle_event(event)
             if ui_action:
-                if ui_action.get("action") == "apply":
-                    self.apply_config_changes()
-                elif ui_action.get("action") == "restart":
-                    self.restart_game()
-                elif ui_action.get("action") == "select_block":
-                    self.handle_preview_click(ui_action.get("index"))
-                elif ui_action.get("action") == "place_block":
-                    self.handle_board_click(ui_action.get("position"))
+                try:
+                    handler = action_handlers[ui_action.get("action")]
+                except KeyError:
+                    pass
+                else:
+                    handler(ui_action)
             
             if event.type == pygame.KEYDOWN:
                 if event.key in (pygame.K_ESCAPE, pygame.K_q):
                     return False
-                elif event.key == pygame.K_F2:
-                    self.restart_game()
-                elif event.key == pygame.K_RETURN and self.engine.game_over:
-                    # Restart game when Enter key is pressed and game is over
-                    self.restart_game()
+                try:
+                    key_handler = key_handlers[event.key]
+                except KeyError:
+                    pass
+                else:
+                    key_handler()
         
         return True
     
@@ -172,7 +215,7 @@ class GameController(BaseController):
             # Cap the frame rate
             self.clock.tick(60)
         
-        pygame.quit()
+        _shutdown_display()
     
     def handle_events(self) -> bool:
         """Process user input events."""
@@ -1,4 +1,5 @@
 # controllers/simulation_controller.py
+import logging
 import time
 import pygame
 from typing import Dict
@@ -8,6 +9,11 @@ from controllers.ai_controller import AIController
 from ai.registry import registry as ai_registry
 from data.stats_manager import StatsManager
 
+logger = logging.getLogger(__name__)
+
+# Config keys that shape the engine itself; changing any of them needs a new GameEngine
+STRUCTURAL_CONFIG_KEYS = ("shapes", "shape_weights", "metrics_weights", "metrics_flow")
+
 
 class SimulationStatsManager:
     """Manages statistics for simulation runs"""
@@ -211,12 +217,16 @@ class SimulationController(GameController):
         new_config = self.main_view.get_config_values()
         if new_config:
             # Update config
+            structural_before = [self.config.get(key) for key in STRUCTURAL_CONFIG_KEYS]
             self.config.update(new_config)
             
-            # Update engine config
-            self.reset_engine(preserve_config=True)
+            # DDA-only changes are applied to the running engine; anything else needs a new one
+            if [self.config.get(key) for key in STRUCTURAL_CONFIG_KEYS] == structural_before:
+                self.engine.reconfigure(self.config)
+            else:
+                self.reset_engine(preserve_config=True)
             
-            print("[controllers/simulation_controller.py][220] Applied configuration changes")
+            logger.debug("Applied configuration changes (%d fields)", len(new_config))
             return True
         return False
     
@@ -5,7 +5,72 @@ from typing import List, Tuple
 class Block:
     """A collection of cells representing a tetromino-like block."""
 
+    __slots__ = ("cells", "height", "width", "_masks", "_offsets")
+
     def __init__(self, cells: List[Tuple[int, int]]) -> None:
-        self.cells = cells
-        self.height = max([r for r, _ in cells]) + 1 if cells else 0
-        self.width = max([c for _, c in cells]) + 1 if cells else 0
+        # Tuple of (row, col) offsets: immutable, so Block instances can be shared safely
+        self.cells = tuple((r, c) for r, c in cells)
+        self.height = max([r for r, _ in self.cells]) + 1 if self.cells else 0
+        self.width = max([c for _, c in self.cells]) + 1 if self.cells else 0
+        # Cell bitmasks and flat cell offsets at the origin, keyed by the board width they were built for
+        self._masks = {}
+        self._offsets = {}
+
+    def mask(self, stride: int) -> int:
+        """Bitmask of the cells anchored at (0, 0) on a board ``stride`` columns wide.
+        
+        Bit ``r * stride + c`` is set for every cell; shifting the mask left by
+        ``top * stride + left`` moves the block to that anchor.
+        
+        Args:
+            stride: Number of columns on the target board
+            
+        Returns:
+            int: Bitmask of the block's cells
+        """
+        mask = self._masks.get(stride)
+        if mask is None:
+            mask = 0
+            for r, c in self.cells:
+                mask |= 1 << (r * stride + c)
+            self._masks[stride] = mask
+        return mask
+
+    def offsets(self, stride: int) -> Tuple[int, ...]:
+        """Flat offsets ``r * stride + c`` of the cells on a board ``stride`` columns wide.
+        
+        Args:
+            stride: Number of columns on the target board
+            
+        Returns:
+            Tuple[int, ...]: One bit offset per cell, in ``cells`` order
+        """
+        offsets = self._offsets.get(stride)
+        if offsets is None:
+            offsets = tuple(r * stride + c for r, c in self.cells)
+            self._offsets[stride] = offsets
+        return offsets
+
+
+# One Block per distinct shape (cell layout), shared by every pool and metrics manager in the
+# process. Shapes come from a small fixed table, so the map stays tiny and is never pruned.
+_SHARED_BLOCKS = {}
+
+
+def shared_block(cells: List[Tuple[int, int]]) -> Block:
+    """Return the shared Block for a cell layout, creating it on first use.
+    
+    Blocks never change after construction, so engines created for every
+    simulation run can reuse the same instances and their cached masks.
+    
+    Args:
+        cells: List of (row, col) offsets
+        
+    Returns:
+        Block: Shared instance for these cells
+    """
+    key = tuple((r, c) for r, c in cells)
+    block = _SHARED_BLOCKS.get(key)
+    if block is None:
+        block = _SHARED_BLOCKS[key] = Block(key)
+    return block
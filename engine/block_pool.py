@@ -1,12 +1,29 @@
 # engine/block_pool.py
 import random
-from typing import Dict, List, Tuple, Any
-from engine.block import Block
+import sys
+from collections import namedtuple
+from itertools import accumulate
+from operator import itemgetter
+from typing import Dict, List, Set, Tuple, Any
+from engine.block import Block, shared_block
+
+# Metric values that drive one tray, read from the metrics dict in a single pass
+_TrayState = namedtuple("_TrayState", "best_fit_block opportunity game_over_blocks score clear_rate")
+# Fetches all of those keys in one C-level call when the metrics dict is complete
+_get_tray_metrics = itemgetter("best_fit_block", "opportunity", "game_over_blocks", "score", "clear_rate")
 
 
 class BlockPool:
     """Block generator with dynamic difficulty adjustment capabilities."""
 
+    __slots__ = (
+        "shapes", "shape_names", "_shape_name_set", "_block_cache", "weights", "config",
+        "tray_counter", "L", "last_generated_blocks",
+        "low_clear_rate", "high_clear_rate", "score_threshold",
+        "n_best_fit_blocks", "n_game_over_blocks", "_cum_weights",
+        "_name_to_idx", "_idx_scratch", "_idx_pos",
+    )
+
     def __init__(self, shapes: Dict[str, List[Tuple[int, int]]], weights: List[int], config=None):
         """Initialize the block pool with shapes, weights, and configuration.
         
@@ -16,14 +33,23 @@ class BlockPool:
             config: Configuration dictionary containing DDA parameters
         """
         self.shapes = shapes
-        self.shape_names = list(shapes.keys())
+        # Interned names make the dict and set lookups below hit the identity fast path
+        self.shape_names = [sys.intern(name) for name in shapes]
+        self._shape_name_set = frozenset(self.shape_names)
+        self._name_to_idx = {name: i for i, name in enumerate(self.shape_names)}
+        # Index permutation reused by the partial Fisher-Yates draw, plus its inverse;
+        # both are restored to the identity after every draw
+        self._idx_scratch = list(range(len(self.shape_names)))
+        self._idx_pos = list(range(len(self.shape_names)))
+        # Blocks are immutable shape descriptors, so one shared instance per shape is enough
+        self._block_cache = {name: shared_block(shapes[name]) for name in self.shape_names}
         self.weights = weights
         self.config = config or {}
         
         # Initialize DDA-related attributes
         self.tray_counter = 0  # Counter to keep track of tray refills
         self.L = 1  # Frequency of best-fit block generation (1-3)
-        self.last_generated_blocks = []  # Keep track of recently generated blocks
+        self.last_generated_blocks = frozenset()  # Shape names from the previous tray
         
         # Load configuration
         self._load_config(self.config)
@@ -36,6 +62,9 @@ class BlockPool:
         if not any(weights) and self.shape_names:
             # If all weights are zero, set uniform weights
             self.weights = [1] * len(self.shape_names)
+        
+        # Cumulative weights, so get_block does not re-accumulate them on every draw
+        self._cum_weights = list(accumulate(self.weights))
 
     def _load_config(self, config: Dict[str, Any]) -> None:
         """Load configuration parameters for block generation.
@@ -53,24 +82,43 @@ class BlockPool:
         self.n_best_fit_blocks = dda_config.get("n_best_fit_blocks", 1)
         self.n_game_over_blocks = dda_config.get("n_game_over_blocks", 1)
 
+    def update_config(self, config: Dict[str, Any]) -> None:
+        """Switch to a new configuration, keeping the shapes, weights and tray history.
+        
+        Args:
+            config: Configuration dictionary containing DDA parameters
+        """
+        self.config = config or {}
+        self._load_config(self.config)
+
     def get_block(self) -> Block:
         """Sample a random block based on shape weights.
         
         Returns:
-            Block: A new block with randomly selected shape
+            Block: A block with randomly selected shape
         """
         if not self.shape_names:
             raise ValueError("[engine/block_pool.py] No shapes available in the block pool")
             
         try:
-            shape_name = random.choices(self.shape_names, weights=self.weights, k=1)[0]
+            shape_name = random.choices(self.shape_names, cum_weights=self._cum_weights, k=1)[0]
         except (ValueError, KeyError) as e:
             # Fallback to uniform selection if weights cause an error
             print(f"[engine/block_pool.py] Warning: Error in weighted selection ({e}), falling back to uniform selection")
             shape_name = random.choice(self.shape_names)
             
-        shape = self.shapes[shape_name]
-        return Block(shape)
+        return self._instantiate_block(shape_name)
+
+    def _instantiate_block(self, shape_name: str) -> Block:
+        """Return the shared Block instance for a shape.
+        
+        Args:
+            shape_name: Name of the shape
+            
+        Returns:
+            Block: Cached block for the shape (must not be mutated by callers)
+        """
+        return self._block_cache[shape_name]
 
     def get_next_blocks(self, engine_state, count=3) -> List[Block]:
         """Get the next blocks based on the game state and difficulty adjustment.
@@ -101,18 +149,7 @@ class BlockPool:
         Returns:
             List[Block]: Generated blocks
         """
-        # Extract metrics
-        best_fit_block = metrics.get("best_fit_block", "None")
-        opportunity = metrics.get("opportunity", False)
-        game_over_blocks = metrics.get("game_over_blocks", ["None"])
-        # If game_over_blocks doesn't exist in metrics (backward compatibility), use game_over_block
-        if "None" in game_over_blocks and game_over_blocks == ["None"]:
-            single_block = metrics.get("game_over_block", "None")
-            if single_block != "None":
-                game_over_blocks = [single_block]
-                
-        score = metrics.get("score", 0)
-        clear_rate = metrics.get("clear_rate", 0.0)
+        best_fit_block, opportunity, game_over_blocks, score, clear_rate = self._read_state(metrics)
         
         # Update L based on clear rate
         self._update_L_value(clear_rate)
@@ -126,10 +163,36 @@ class BlockPool:
             blocks = self._generate_blocks_above_threshold(game_over_blocks, opportunity, count)
         
         # Store generated block names for future reference
-        self.last_generated_blocks = [b.get_shape_name() for b in blocks if hasattr(b, 'get_shape_name')]
+        self.last_generated_blocks = frozenset(b.get_shape_name() for b in blocks if hasattr(b, 'get_shape_name'))
         
         return blocks
     
+    @staticmethod
+    def _read_state(metrics: Dict[str, Any]) -> _TrayState:
+        """Read the metric values used for tray generation.
+        
+        Args:
+            metrics: Current game metrics
+            
+        Returns:
+            _TrayState with best fit, opportunity, game over blocks, score and clear rate
+        """
+        try:
+            best_fit_block, opportunity, game_over_blocks, score, clear_rate = _get_tray_metrics(metrics)
+        except KeyError:
+            # Partial metrics (older engines, tests): fall back to per-key defaults
+            get = metrics.get
+            best_fit_block = get("best_fit_block", "None")
+            opportunity = get("opportunity", False)
+            game_over_blocks = get("game_over_blocks")
+            score = get("score", 0)
+            clear_rate = get("clear_rate", 0.0)
+        # If game_over_blocks doesn't exist in metrics (backward compatibility), use game_over_block
+        if game_over_blocks is None or game_over_blocks == ["None"]:
+            single_block = metrics.get("game_over_block", "None")
+            game_over_blocks = [single_block] if single_block != "None" else ["None"]
+        return _TrayState(best_fit_block, opportunity, game_over_blocks, score, clear_rate)
+    
     def _update_L_value(self, clear_rate: float) -> None:
         """Update the L value based on clear rate.
         
@@ -156,62 +219,38 @@ class BlockPool:
         Returns:
             List[Block]: Generated blocks
         """
-        blocks = []
         game_over_blocks = game_over_blocks or ["None"]
         
-        # Filter out "None" from game_over_blocks
-        excluded_shapes = [block for block in game_over_blocks if block != "None"]
+        # Filter out "None" (and unknown names, which could never be drawn anyway)
+        shape_name_set = self._shape_name_set
+        excluded_shapes = [block for block in game_over_blocks if block in shape_name_set]
+        best_fit_valid = best_fit_block in shape_name_set
         
+        # Decide whether this tray carries best fit blocks:
+        # low clear rate every tray, medium every 2nd tray, high every 3rd tray
+        tray_counter = self.tray_counter
         if clear_rate < self.low_clear_rate:
-            # Low clear rate: Generate n best fit blocks and random blocks
-            if best_fit_block != "None" and best_fit_block in self.shape_names:
-                # Add best fit blocks
-                for _ in range(min(self.n_best_fit_blocks, count)):
-                    blocks.append(Block(self.shapes[best_fit_block]))
-                
-                # Add random blocks to complete the count
-                if best_fit_block not in excluded_shapes:
-                    excluded_shapes.append(best_fit_block)
-                random_blocks = self._select_distinct_blocks(count - len(blocks), excluded_shapes)
-                blocks.extend(random_blocks)
-            else:
-                # If no best fit block, generate all random blocks
-                blocks = self._select_distinct_blocks(count, excluded_shapes)
-                
+            best_fit_tray = True
         elif clear_rate < self.high_clear_rate:
-            # Medium clear rate: Every 2nd tray has best fit blocks
-            if self.tray_counter % 2 == 0 and best_fit_block != "None" and best_fit_block in self.shape_names:
-                # Add best fit blocks
-                for _ in range(min(self.n_best_fit_blocks, count)):
-                    blocks.append(Block(self.shapes[best_fit_block]))
-                
-                # Add random blocks to complete the count
-                if best_fit_block not in excluded_shapes:
-                    excluded_shapes.append(best_fit_block)
-                random_blocks = self._select_distinct_blocks(count - len(blocks), excluded_shapes)
-                blocks.extend(random_blocks)
-            else:
-                # First tray or non-best-fit tray: all random blocks
-                blocks = self._select_distinct_blocks(count, excluded_shapes)
-                
+            best_fit_tray = tray_counter % 2 == 0
+        else:
+            best_fit_tray = tray_counter % 3 == 0
+        
+        if best_fit_tray and best_fit_valid:
+            # Add best fit blocks (the shared instance, repeated)
+            blocks = [self._instantiate_block(best_fit_block)] * min(self.n_best_fit_blocks, count)
+            
+            # Add random blocks to complete the count
+            if best_fit_block not in excluded_shapes:
+                excluded_shapes.append(best_fit_block)
+            blocks.extend(self._select_distinct_blocks(count - len(blocks), excluded_shapes))
         else:
-            # High clear rate: Every 3rd tray has best fit blocks
-            if self.tray_counter % 3 == 0 and best_fit_block != "None" and best_fit_block in self.shape_names:
-                # Add best fit blocks
-                for _ in range(min(self.n_best_fit_blocks, count)):
-                    blocks.append(Block(self.shapes[best_fit_block]))
-                
-                # Add random blocks to complete the count
-                if best_fit_block not in excluded_shapes:
-                    excluded_shapes.append(best_fit_block)
-                random_blocks = self._select_distinct_blocks(count - len(blocks), excluded_shapes)
-                blocks.extend(random_blocks)
-            else:
-                # Not a best-fit tray: all random blocks
-                blocks = self._select_distinct_blocks(count, excluded_shapes)
-        
-        # Shuffle to avoid predictable patterns
-        random.shuffle(blocks)
+            # No best fit block or not a best-fit tray: all random blocks
+            blocks = self._select_distinct_blocks(count, excluded_shapes)
+        
+        # Shuffle to avoid predictable patterns (a single block has no order to shuffle)
+        if len(blocks) > 1:
+            random.shuffle(blocks)
         return blocks
     
     def _generate_blocks_above_threshold(self, game_over_blocks: List[str], opportunity: bool, count: int) -> List[Block]:
@@ -225,32 +264,80 @@ class BlockPool:
         Returns:
             List[Block]: Generated blocks
         """
-        blocks = []
-        
-        # Filter out "None" from game_over_blocks
-        valid_game_over_blocks = [block for block in game_over_blocks if block != "None" and block in self.shape_names]
+        # Keep only known shapes ("None" is never a shape name)
+        shape_name_set = self._shape_name_set
+        valid_game_over_blocks = [block for block in game_over_blocks if block in shape_name_set]
         
         # Generate game over blocks if opportunity exists
         if opportunity and valid_game_over_blocks:
             # Select a game over block (for consistency, use the first one if multiple exist)
             game_over_block = valid_game_over_blocks[0]
             
-            # Add game over blocks
-            for _ in range(min(self.n_game_over_blocks, count)):
-                blocks.append(Block(self.shapes[game_over_block]))
+            # Add game over blocks (the shared instance, repeated)
+            blocks = [self._instantiate_block(game_over_block)] * min(self.n_game_over_blocks, count)
             
             # Add random blocks to complete the count
-            excluded_shapes = valid_game_over_blocks.copy()
-            random_blocks = self._select_distinct_blocks(count - len(blocks), excluded_shapes)
-            blocks.extend(random_blocks)
+            excluded_shapes = list(valid_game_over_blocks)
+            blocks.extend(self._select_distinct_blocks(count - len(blocks), excluded_shapes))
         else:
             # If no game over opportunity, generate all random blocks
             blocks = self._select_distinct_blocks(count)
         
-        # Shuffle to avoid predictable patterns
-        random.shuffle(blocks)
+        # Shuffle to avoid predictable patterns (a single block has no order to shuffle)
+        if len(blocks) > 1:
+            random.shuffle(blocks)
         return blocks
     
+    def _draw_distinct_names(self, count: int, banned: Set[int]) -> List[str]:
+        """Draw distinct shape names with a partial Fisher-Yates shuffle over indices.
+        
+        Banned indices are swapped to the front of the scratch permutation and
+        the shuffle starts after them, so no filtered copy of the shape list is
+        built. Every swap is undone afterwards to keep the scratch lists intact.
+        
+        Args:
+            count: Number of names to draw
+            banned: Indices of shapes that must not be drawn
+            
+        Returns:
+            List[str]: Drawn shape names in draw order; every allowed name (in random
+            order) when count exceeds the number of allowed shapes
+        """
+        scratch = self._idx_scratch
+        pos = self._idx_pos
+        n = len(scratch)
+        swaps = []
+        
+        def swap(i: int, j: int) -> None:
+            a, b = scratch[i], scratch[j]
+            scratch[i], scratch[j] = b, a
+            pos[a], pos[b] = j, i
+            swaps.append((i, j))
+        
+        start = 0
+        for idx in banned:
+            p = pos[idx]
+            if p != start:
+                swap(start, p)
+            start += 1
+        
+        end = min(start + count, n)
+        randrange = random.randrange
+        for i in range(start, end):
+            j = randrange(i, n)
+            if j != i:
+                swap(i, j)
+        
+        names = self.shape_names
+        drawn = [names[scratch[i]] for i in range(start, end)]
+        
+        # Undo in reverse order so scratch and pos return to the identity
+        for i, j in reversed(swaps):
+            a, b = scratch[i], scratch[j]
+            scratch[i], scratch[j] = b, a
+            pos[a], pos[b] = j, i
+        return drawn
+    
     def _select_distinct_blocks(self, count: int, excluded_shapes: List[str] = None) -> List[Block]:
         """Select distinct blocks with optional exclusions.
         
@@ -261,33 +348,33 @@ class BlockPool:
         Returns:
             List[Block]: List of distinct blocks
         """
-        if excluded_shapes is None:
-            excluded_shapes = []
+        if count <= 0:
+            return []
         
-        # Get all available shapes, excluding the specified ones
-        available_shapes = [s for s in self.shape_names if s not in excluded_shapes]
+        # Single unrestricted draw: random.choice picks exactly what random.sample(..., 1) would
+        if count == 1 and not excluded_shapes and not self.last_generated_blocks:
+            return [self._instantiate_block(random.choice(self.shape_names))]
         
-        # Also exclude recently generated blocks to increase variety
-        available_shapes = [s for s in available_shapes if s not in self.last_generated_blocks]
+        # Indices of the excluded shapes (unknown names exclude nothing)
+        name_to_idx = self._name_to_idx
+        n = len(self.shape_names)
+        banned = {name_to_idx[s] for s in excluded_shapes if s in name_to_idx} if excluded_shapes else set()
         
-        # If too many exclusions, fall back to all shapes except excluded ones
-        if len(available_shapes) < count:
-            available_shapes = [s for s in self.shape_names if s not in excluded_shapes]
+        # Also exclude recently generated blocks to increase variety, unless too few shapes remain
+        if self.last_generated_blocks:
+            with_recent = banned | {name_to_idx[s] for s in self.last_generated_blocks if s in name_to_idx}
+            if n - len(with_recent) >= count:
+                banned = with_recent
         
         # If still not enough shapes, just use what we have with potential duplicates
-        if len(available_shapes) < count:
-            selected_blocks = []
-            for _ in range(count):
-                if available_shapes:
-                    shape_name = random.choice(available_shapes)
-                    selected_blocks.append(Block(self.shapes[shape_name]))
-                else:
-                    # Ultimate fallback: use any shape
-                    shape_name = random.choice(self.shape_names)
-                    selected_blocks.append(Block(self.shapes[shape_name]))
+        if n - len(banned) < count:
+            allowed_shapes = [s for i, s in enumerate(self.shape_names) if i not in banned]
+            # Ultimate fallback when everything is excluded: use any shape
+            population = allowed_shapes or self.shape_names
+            selected_shape_names = random.choices(population, k=count)
         else:
             # Enough distinct shapes available
-            selected_shape_names = random.sample(available_shapes, count)
-            selected_blocks = [Block(self.shapes[name]) for name in selected_shape_names]
+            selected_shape_names = self._draw_distinct_names(count, banned)
         
-        return selected_blocks
+        block_cache = self._block_cache
+        return [block_cache[name] for name in selected_shape_names]
@@ -1,13 +1,176 @@
 # engine/board.py
+import logging
 from typing import Set, Tuple, List
 
+logger = logging.getLogger(__name__)
+
+# Maps a cell byte to an ASCII binary digit so a row can be packed with int(..., 2)
+_BIT_DIGITS = b"0" + b"1" * 255
+
+# In-bounds anchor masks keyed by (rows, cols, block height, block width)
+_ANCHOR_MASKS = {}
+
+# Raw byte write for the board's own bookkeeping, bypassing _GridRow.__setitem__
+_set_byte = bytearray.__setitem__
+
+
+# Full-row and full-column masks keyed by (rows, cols)
+_LINE_MASKS = {}
+
+
+def _line_masks(rows: int, cols: int) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+    """Return (row masks, column masks) for a rows×cols bitboard."""
+    masks = _LINE_MASKS.get((rows, cols))
+    if masks is None:
+        row_mask = (1 << cols) - 1
+        col_mask = 0
+        for r in range(rows):
+            col_mask |= 1 << (r * cols)
+        masks = (
+            tuple(row_mask << (r * cols) for r in range(rows)),
+            tuple(col_mask << c for c in range(cols)),
+        )
+        _LINE_MASKS[(rows, cols)] = masks
+    return masks
+
+
+def _fold_and(bits: int, length: int, stride: int) -> int:
+    """AND ``length`` cells spaced ``stride`` bits apart into the first cell's bit.
+    
+    Each pass ANDs the board with a shifted copy of itself, doubling the span
+    every bit already covers, so a line of n cells takes about log2(n) passes.
+    """
+    span = 1
+    while span < length:
+        step = min(span, length - span)
+        bits &= bits >> (step * stride)
+        span += step
+    return bits
+
+
+def _count_full_lines(bits: int, rows: int, cols: int) -> Tuple[int, int]:
+    """Count (full rows, full columns) on a bitboard with SWAR folds instead of per-line tests."""
+    row_masks, col_masks = _line_masks(rows, cols)
+    # Bit r * cols survives the row fold only if row r is full; bit c survives the column fold
+    # only if column c is full
+    # bin().count rather than int.bit_count, which needs Python 3.10
+    full_rows = bin(_fold_and(bits, cols, 1) & col_masks[0]).count("1")
+    full_cols = bin(_fold_and(bits, rows, cols) & row_masks[0]).count("1")
+    return full_rows, full_cols
+
+
+def _anchor_mask(rows: int, cols: int, height: int, width: int) -> int:
+    """Bitmask of the anchors where a height×width bounding box stays on the board."""
+    key = (rows, cols, height, width)
+    mask = _ANCHOR_MASKS.get(key)
+    if mask is None:
+        mask = 0
+        tops = min(rows, rows - height + 1)
+        lefts = min(cols, cols - width + 1)
+        if tops > 0 and lefts > 0:
+            row_mask = (1 << lefts) - 1
+            for r in range(tops):
+                mask |= row_mask << (r * cols)
+        _ANCHOR_MASKS[key] = mask
+    return mask
+
+
+class _GridRow(bytearray):
+    """One row of ``Board.grid``; cell writes keep the board's counts and bitboard in sync.
+    
+    Reads are plain bytearray indexing, only assignment is routed through the board.
+    """
+
+    __slots__ = ("_board", "_row")
+
+    def __setitem__(self, index, value) -> None:
+        if isinstance(index, slice):
+            _set_byte(self, index, value)
+            self._board._sync_counts()
+        else:
+            self._board.set_cell(self._row, index, value)
+
+
 class Board:
-    """8×8 grid that supports placement and line clears."""
+    """8×8 grid that supports placement and line clears.
+    
+    Besides the 2D grid, the board keeps a bitboard (bit ``r * cols + c`` set
+    for a filled cell) that placement checks test with a single mask.
+    """
+
+    __slots__ = ("rows", "cols", "_grid", "_bits", "row_counts", "col_counts", "_snapshot")
 
     def __init__(self, rows: int = 8, cols: int = 8) -> None:
         self.rows = rows
         self.cols = cols
-        self.grid = [[0] * cols for _ in range(rows)]
+        self.grid = [bytearray(cols) for _ in range(rows)]
+
+    @property
+    def grid(self) -> List[bytearray]:
+        """List of rows, each a bytearray of cells (non-zero = filled).
+        
+        Writing ``grid[r][c]`` goes through ``set_cell``, so the fill counts and
+        the bitboard follow hand edits.
+        """
+        return self._grid
+
+    @grid.setter
+    def grid(self, grid: List[List[int]]) -> None:
+        """Replace the grid and rebuild the per-line fill counts and the bitboard.
+        
+        Rows are copied, so any nested list of 0/1 values can be assigned.
+        """
+        self._grid = self._own_rows(grid)
+        self._sync_counts()
+
+    def _own_rows(self, grid) -> List[bytearray]:
+        """Copy ``grid`` into rows whose cell writes report back to this board."""
+        rows = []
+        for r, source in enumerate(grid):
+            row = _GridRow(source)
+            row._board = self
+            row._row = r
+            rows.append(row)
+        return rows
+
+    def _sync_counts(self) -> None:
+        """Rebuild the per-line fill counts and the bitboard from the grid."""
+        grid = self._grid
+        self.row_counts = [len(row) - row.count(0) for row in grid]
+        self.col_counts = [len(col) - col.count(0) for col in zip(*grid)] if grid else [0] * self.cols
+        bits = 0
+        shift = 0
+        for row in grid:
+            if row:
+                # Reverse so column 0 lands on the lowest bit of the row
+                bits |= int(row.translate(_BIT_DIGITS)[::-1], 2) << shift
+            shift += self.cols
+        self._bits = bits
+        self._snapshot = None
+
+    def set_cell(self, row: int, col: int, value: int) -> None:
+        """Set one cell, updating the fill counts and the bitboard when it flips.
+        
+        Args:
+            row: Row index
+            col: Column index
+            value: New cell value (non-zero = filled)
+        """
+        grid_row = self._grid[row]
+        was_filled = grid_row[col] != 0
+        _set_byte(grid_row, col, value)
+        if (value != 0) != was_filled:
+            row %= self.rows
+            col %= self.cols
+            delta = -1 if was_filled else 1
+            self.row_counts[row] += delta
+            self.col_counts[col] += delta
+            self._bits ^= 1 << (row * self.cols + col)
+
+    @property
+    def bits(self) -> int:
+        """Bitboard of the filled cells (bit ``r * cols + c``), read-only."""
+        return self._bits
 
     @staticmethod
     def from_grid(grid: List[List[int]]) -> 'Board':
@@ -21,52 +184,216 @@ class Board:
         """
         rows = len(grid)
         cols = len(grid[0]) if rows > 0 else 0
-        board = Board(rows, cols)
-        board.grid = [row[:] for row in grid]  # Create a deep copy of the grid
+        # Skip __init__ so the empty grid and its counts are not built only to be replaced
+        board = Board.__new__(Board)
+        board.rows = rows
+        board.cols = cols
+        board.grid = grid  # The grid setter copies every row
         return board
 
+    def copy(self) -> 'Board':
+        """Return an independent copy, reusing the counts and bitboard as they are.
+        
+        Returns:
+            New Board instance with copied rows, counts and bitboard
+        """
+        board = Board.__new__(Board)
+        board.rows = self.rows
+        board.cols = self.cols
+        board._grid = board._own_rows(self._grid)
+        board._bits = self._bits
+        board.row_counts = self.row_counts[:]
+        board.col_counts = self.col_counts[:]
+        board._snapshot = self._snapshot
+        return board
+
+    def __deepcopy__(self, memo) -> 'Board':
+        """Copy via ``copy``; bytearray rows are slow to deep-copy generically."""
+        return self.copy()
+
+    def snapshot(self) -> Tuple[Tuple[int, ...], ...]:
+        """Immutable copy of the grid, rebuilt only after the bitboard changed.
+        
+        Returns:
+            Tuple of row tuples; safe to hand out and hold across moves
+        """
+        snapshot = self._snapshot
+        if snapshot is None or snapshot[0] != self._bits:
+            snapshot = self._snapshot = (self._bits, tuple(map(tuple, self._grid)))
+        return snapshot[1]
+
     # ────────────────────────── placement helpers ──────────────────────────
 
     def can_place(self, block, top: int, left: int) -> bool:
         """True if every cell fits inside the board and is currently empty."""
-        for r_off, c_off in block.cells:
-            r, c = top + r_off, left + c_off
-            if not (0 <= r < self.rows and 0 <= c < self.cols):
-                return False
-            if self.grid[r][c]:
-                return False
-        return True
+        # Block offsets start at (0, 0), so the bounding box decides the bounds check once
+        cols = self.cols
+        if top < 0 or left < 0 or top + block.height > self.rows or left + block.width > cols:
+            return False
+        return not self._bits & (block.mask(cols) << (top * cols + left))
+
+    def placement_mask(self, block) -> int:
+        """Bitmask of every anchor where ``block`` fits, bit ``top * cols + left``.
+        
+        An anchor is blocked when any cell offset lands on a filled cell, so the
+        board shifted right by each offset, OR-ed together, marks every blocked
+        anchor at once instead of testing anchors one by one.
+        
+        Args:
+            block: Block to place
+            
+        Returns:
+            int: Mask of valid anchors (0 if the block fits nowhere)
+        """
+        cols = self.cols
+        anchors = _anchor_mask(self.rows, cols, block.height, block.width)
+        if not anchors:
+            return 0
+        bits = self._bits
+        blocked = 0
+        for offset in block.offsets(cols):
+            blocked |= bits >> offset
+        return anchors & ~blocked
+
+    def valid_anchors(self, block) -> List[Tuple[int, int]]:
+        """List every (top, left) anchor where ``block`` fits, in row-major order.
+        
+        Args:
+            block: Block to place
+            
+        Returns:
+            List of (row, col) anchors decoded from ``placement_mask``
+        """
+        mask = self.placement_mask(block)
+        cols = self.cols
+        anchors = []
+        while mask:
+            low = mask & -mask
+            anchors.append(divmod(low.bit_length() - 1, cols))
+            mask ^= low
+        return anchors
+
+    def lines_cleared_by(self, block, top: int, left: int) -> int:
+        """Count the rows and columns that would be full after placing ``block``.
+        
+        Works on a copy of the bitboard only, so nothing is allocated or mutated;
+        the result matches ``place_block`` followed by ``clear_full_lines``.
+        
+        Args:
+            block: Block to place (assumes can_place is True)
+            top: Row of the block's anchor
+            left: Column of the block's anchor
+            
+        Returns:
+            int: Number of full rows plus full columns
+        """
+        cols = self.cols
+        bits = self._bits | (block.mask(cols) << (top * cols + left))
+        full_rows, full_cols = _count_full_lines(bits, self.rows, cols)
+        return full_rows + full_cols
+
+    def cells_cleared_by(self, block, top: int, left: int) -> int:
+        """Count the cells that full lines would remove after placing ``block``.
+        
+        Like ``lines_cleared_by`` this only looks at a copy of the bitboard; the
+        result matches ``len(find_full_lines())`` after ``place_block``.
+        
+        Args:
+            block: Block to place (assumes can_place is True)
+            top: Row of the block's anchor
+            left: Column of the block's anchor
+            
+        Returns:
+            int: Number of distinct cells in full rows and columns
+        """
+        cols, rows = self.cols, self.rows
+        bits = self._bits | (block.mask(cols) << (top * cols + left))
+        full_rows, full_cols = _count_full_lines(bits, rows, cols)
+        return full_rows * cols + full_cols * rows - full_rows * full_cols
 
     def place_block(self, block, top: int, left: int) -> None:
         """Write block cells into the grid (assumes can_place is True)."""
+        grid = self._grid
+        row_counts = self.row_counts
+        col_counts = self.col_counts
         for r_off, c_off in block.cells:
-            self.grid[top + r_off][left + c_off] = 1
+            r, c = top + r_off, left + c_off
+            row = grid[r]
+            if not row[c]:
+                _set_byte(row, c, 1)
+                row_counts[r] += 1
+                col_counts[c] += 1
+        self._bits |= block.mask(self.cols) << (top * self.cols + left)
 
     # ───────────────────────────── line clears ─────────────────────────────
 
+    def _find_full_rows_cols(self) -> Tuple[List[int], List[int]]:
+        """Find the indices of all full rows and columns.
+        
+        Returns:
+            Tuple of (full row indices, full column indices).
+        """
+        full_rows = [r for r, count in enumerate(self.row_counts) if count == self.cols]
+        full_cols = [c for c, count in enumerate(self.col_counts) if count == self.rows]
+        return full_rows, full_cols
+
+    def count_full_lines(self) -> int:
+        """Count the full rows plus full columns from the fill counts.
+        
+        Returns:
+            int: Number of complete lines currently on the board
+        """
+        cols, rows = self.cols, self.rows
+        return self.row_counts.count(cols) + self.col_counts.count(rows)
+
+    def count_full_line_cells(self) -> int:
+        """Count the distinct cells covered by full rows and columns.
+        
+        Returns:
+            int: Same as ``len(find_full_lines())`` without building the set
+        """
+        cols, rows = self.cols, self.rows
+        full_rows = self.row_counts.count(cols)
+        full_cols = self.col_counts.count(rows)
+        return full_rows * cols + full_cols * rows - full_rows * full_cols
+
+    def full_line_mask(self) -> int:
+        """Bitmask of every cell in a full row or column (bit ``r * cols + c``).
+        
+        Returns:
+            int: Cells ``find_full_lines`` would report, packed into one int
+        """
+        row_masks, col_masks = _line_masks(self.rows, self.cols)
+        cols, rows = self.cols, self.rows
+        mask = 0
+        for r, count in enumerate(self.row_counts):
+            if count == cols:
+                mask |= row_masks[r]
+        for c, count in enumerate(self.col_counts):
+            if count == rows:
+                mask |= col_masks[c]
+        return mask
+
     def find_full_lines(self) -> Set[Tuple[int, int]]:
         """Find all cells that are part of full rows or columns.
         
         Returns:
             Set of (row, col) tuples that are part of full lines.
         """
-        cells_to_clear = set()
-        
-        # Find full rows
-        for r in range(self.rows):
-            if all(self.grid[r][c] for c in range(self.cols)):
-                print(f"[engine/board.py][59] Found full row at {r}")
-                for c in range(self.cols):
-                    cells_to_clear.add((r, c))
-        
-        # Find full cols
-        for c in range(self.cols):
-            if all(self.grid[r][c] for r in range(self.rows)):
-                print(f"[engine/board.py][64] Found full column at {c}")
-                for r in range(self.rows):
-                    cells_to_clear.add((r, c))
+        full_rows, full_cols = self._find_full_rows_cols()
+        col_range = range(self.cols)
+        row_range = range(self.rows)
+        cells = []
+        
+        for r in full_rows:
+            logger.debug("Found full row at %d", r)
+            cells.extend([(r, c) for c in col_range])
+        
+        for c in full_cols:
+            logger.debug("Found full column at %d", c)
+            cells.extend([(r, c) for r in row_range])
                     
-        return cells_to_clear
+        return set(cells)
     
     def clear_cells(self, cells: Set[Tuple[int, int]]) -> None:
         """Clear specific cells from the grid.
@@ -74,27 +401,74 @@ class Board:
         Args:
             cells: Set of (row, col) tuples to clear
         """
+        grid = self._grid
+        rows, cols = self.rows, self.cols
+        row_counts = self.row_counts
+        col_counts = self.col_counts
+        cleared = 0
         for r, c in cells:
-            if 0 <= r < self.rows and 0 <= c < self.cols:
-                self.grid[r][c] = 0
+            if 0 <= r < rows and 0 <= c < cols and grid[r][c]:
+                _set_byte(grid[r], c, 0)
+                row_counts[r] -= 1
+                col_counts[c] -= 1
+                cleared |= 1 << (r * cols + c)
+        self._bits &= ~cleared
+
+    def clear_mask(self, mask: int) -> None:
+        """Clear the cells whose bits are set in ``mask`` (see ``full_line_mask``).
+        
+        Args:
+            mask: Bitmask of cells to clear; bits of empty cells are ignored
+        """
+        mask &= self._bits
+        if not mask:
+            return
+        grid = self._grid
+        row_counts = self.row_counts
+        col_counts = self.col_counts
+        cols = self.cols
+        remaining = mask
+        while remaining:
+            low = remaining & -remaining
+            r, c = divmod(low.bit_length() - 1, cols)
+            _set_byte(grid[r], c, 0)
+            row_counts[r] -= 1
+            col_counts[c] -= 1
+            remaining ^= low
+        self._bits &= ~mask
 
     def clear_full_lines(self) -> int:
         """Clear any full rows/cols; return number of lines removed."""
-        # Identify full rows and columns
-        full_rows = [r for r in range(self.rows) if all(self.grid[r][c] for c in range(self.cols))]
-        full_cols = [c for c in range(self.cols) if all(self.grid[r][c] for r in range(self.rows))]
+        # Identify full rows and columns; nothing to build when no line is complete
+        full_rows, full_cols = self._find_full_rows_cols()
+        if not full_rows and not full_cols:
+            return 0
 
-        # Collect all cells to clear
-        cells_to_clear = set()
+        # Zero the lines in place instead of collecting (row, col) tuples
+        grid = self._grid
+        row_counts = self.row_counts
+        col_counts = self.col_counts
+        cols = self.cols
+        empty_row = bytes(cols)
+        row_mask = (1 << cols) - 1
+        cleared = 0
         for r in full_rows:
-            for c in range(self.cols):
-                cells_to_clear.add((r, c))
+            # A full row has every cell filled, so each column loses exactly one
+            _set_byte(grid[r], slice(None), empty_row)
+            row_counts[r] = 0
+            for c in range(cols):
+                col_counts[c] -= 1
+            cleared |= row_mask << (r * cols)
         for c in full_cols:
+            # Cells shared with a cleared row are already empty
             for r in range(self.rows):
-                cells_to_clear.add((r, c))
-
-        # Clear the identified cells
-        self.clear_cells(cells_to_clear)
+                row = grid[r]
+                if row[c]:
+                    _set_byte(row, c, 0)
+                    row_counts[r] -= 1
+                cleared |= 1 << (r * cols + c)
+            col_counts[c] = 0
+        self._bits &= ~cleared
 
         # Return the number of lines cleared (rows + columns)
         return len(full_rows) + len(full_cols)
@@ -1,5 +1,6 @@
 # engine/game_engine.py
-from typing import Dict, List, Tuple, Optional, Set
+import logging
+from typing import Dict, Tuple, Optional, Set, Sequence
 
 from engine.board import Board
 from engine.block_pool import BlockPool
@@ -8,10 +9,20 @@ from ui.animation import AnimationManager, FadeoutAnimation
 from utils.metrics_manager import MetricsManager
 from config.defaults import DEFAULT_WEIGHTS, SHAPES
 
+logger = logging.getLogger(__name__)
+
 
 class GameEngine:
     """Core game loop & scoring logic."""
 
+    __slots__ = (
+        "config", "board", "score", "lines", "blocks_placed", "_game_over",
+        "_block_metrics_stale", "metrics_manager", "_update_preview_metrics", "pool", "_current_block",
+        "_preview_blocks", "_preview_snapshot", "_selected_preview_index",
+        "animation_manager", "animation_duration_ms", "_placeable_cache",
+        "_game_state_key",
+    )
+
     def __init__(self, config: Dict):
         self.config = config
         
@@ -28,14 +39,23 @@ class GameEngine:
         self.lines = 0
         self.blocks_placed = 0
         self._game_over = False
+        # True when the board changed after the last best-fit / game-over scan
+        self._block_metrics_stale = True
+        # (bitboard, {block: placement mask}) for the board the masks were computed on
+        self._placeable_cache = (None, {})
+        # (bitboard, preview tuple) the game state metrics were last computed for,
+        # None after a block metrics rescan
+        self._game_state_key = None
 
         # Initialize metrics manager
         try:
             self.metrics_manager = MetricsManager(config)
         except Exception as e:
-            print(f"[engine/game_engine.py] Error initializing MetricsManager: {e}")
+            logger.error("Error initializing MetricsManager: %s", e)
             # Continue without full metrics tracking if something fails
             self.metrics_manager = MetricsManager({})
+        # Optional preview hook, looked up once instead of on every refill
+        self._update_preview_metrics = getattr(self.metrics_manager, "update_preview_blocks", None)
 
         # Initialize block pool with configuration
         try:
@@ -45,7 +65,7 @@ class GameEngine:
                 self.config
             )
         except Exception as e:
-            print(f"[engine/game_engine.py] Error initializing BlockPool: {e}, using fallback defaults")
+            logger.error("Error initializing BlockPool: %s, using fallback defaults", e)
             # Fallback to default shapes and weights
             self.config["shapes"] = SHAPES.copy()
             self.config["shape_weights"] = DEFAULT_WEIGHTS
@@ -55,6 +75,7 @@ class GameEngine:
         
         # Preview management
         self._preview_blocks = []  # List of blocks (no rotation)
+        self._preview_snapshot = None  # Tuple handed out by get_preview_blocks, None once stale
         self._selected_preview_index = None
         
         # Animation management
@@ -65,9 +86,10 @@ class GameEngine:
         try:
             self._refill_preview()
         except Exception as e:
-            print(f"[engine/game_engine.py][68] Error filling preview: {e}")
+            logger.error("Error filling preview: %s", e)
             # If refill fails, initialize with empty preview
             self._preview_blocks = []
+            self._preview_snapshot = None
             self._selected_preview_index = None
 
     @staticmethod
@@ -85,13 +107,27 @@ class GameEngine:
 
     # ───────────────────────── Public API ──────────────────────────
 
-    def get_board_state(self) -> List[List[int]]:
-        """Get the current board grid state (read-only)."""
-        return [row[:] for row in self.board.grid]
+    def reconfigure(self, config: Dict) -> None:
+        """Apply DDA parameter changes without restarting the game.
+        
+        Only valid when the structural settings (shapes, weights, metric weights)
+        are unchanged; the board, score, preview and metrics are kept as they are.
+        
+        Args:
+            config: Updated game configuration
+        """
+        self.config = config
+        self.pool.update_config(config)
+    
+    def get_board_state(self) -> Sequence[Sequence[int]]:
+        """Get the current board grid state (read-only, shared until the board changes)."""
+        return self.board.snapshot()
     
-    def get_preview_blocks(self) -> List[Block]:
-        """Get the current preview blocks (read-only)."""
-        return self._preview_blocks.copy()
+    def get_preview_blocks(self) -> Sequence[Block]:
+        """Get the current preview blocks (read-only, shared until the preview changes)."""
+        if self._preview_snapshot is None:
+            self._preview_snapshot = tuple(self._preview_blocks)
+        return self._preview_snapshot
     
     def get_selected_preview_index(self) -> Optional[int]:
         """Get the index of the currently selected preview block."""
@@ -116,33 +152,45 @@ class GameEngine:
         """
         if 0 <= index < len(self._preview_blocks):
             self._selected_preview_index = index
-            print(f"[engine/game_engine.py][286] Selected preview block at index: {index}")
+            logger.debug("Selected preview block at index: %d", index)
             return True
         return False
     
-    def get_valid_placements(self, block_index: Optional[int] = None) -> Set[Tuple[int, int]]:
-        """Get all valid (row, col) positions where the specified block can be placed.
+    def get_valid_placement_mask(self, block_index: Optional[int] = None) -> int:
+        """Get the valid anchors of the specified block as a bitmap.
         
         Args:
             block_index: Index of the preview block (defaults to selected block)
             
         Returns:
-            Set of (row, col) tuples where the block can be placed
+            int: Bit ``row * board.cols + col`` set for every valid anchor (0 if none)
         """
         if block_index is None:
             block_index = self._selected_preview_index
             
         if block_index is None or not (0 <= block_index < len(self._preview_blocks)):
-            return set()
+            return 0
             
-        block = self._preview_blocks[block_index]
+        return self._placement_mask(self._preview_blocks[block_index])
+    
+    def get_valid_placements(self, block_index: Optional[int] = None) -> Set[Tuple[int, int]]:
+        """Get all valid (row, col) positions where the specified block can be placed.
+        
+        Prefer ``get_valid_placement_mask`` when the positions do not need to be tuples.
         
-        # Find all valid placements
+        Args:
+            block_index: Index of the preview block (defaults to selected block)
+            
+        Returns:
+            Set of (row, col) tuples where the block can be placed
+        """
+        mask = self.get_valid_placement_mask(block_index)
+        cols = self.board.cols
         valid_positions = set()
-        for r in range(self.board.rows):
-            for c in range(self.board.cols):
-                if self.board.can_place(block, r, c):
-                    valid_positions.add((r, c))
+        while mask:
+            low = mask & -mask
+            valid_positions.add(divmod(low.bit_length() - 1, cols))
+            mask ^= low
                     
         return valid_positions
     
@@ -172,31 +220,31 @@ class GameEngine:
             
         # Place the block
         self.board.place_block(block, row, col)
-        print(f"[engine/game_engine.py][175] Placed block at {row}, {col}")
+        logger.debug("Placed block at %d, %d", row, col)
         self.blocks_placed += 1
+        self._block_metrics_stale = True
         
-        # Find cells to clear and create animation
-        cells_to_clear = self.board.find_full_lines()
-        line_count = self._count_lines_from_cells(cells_to_clear)
+        # Count completed lines from the fill counts
+        line_count = self.board.count_full_lines()
         
         # Handle line clearing with animation if lines were cleared
-        if cells_to_clear:
+        if line_count:
             if self.animation_duration_ms > 0:
-                # Create fadeout animation for cleared cells
+                # Create fadeout animation for the cleared cells, packed as a bitmask
                 self.animation_manager.add_animation(
-                    FadeoutAnimation(cells_to_clear, self.animation_duration_ms)
+                    FadeoutAnimation(self.board.full_line_mask(), self.board.cols, self.animation_duration_ms)
                 )
                 # Update lines count (count of lines cleared)
                 self.lines += line_count
                 self.metrics_manager.lines_cleared += line_count
                 # Update score based on number of cells cleared
-                self.score += self.compute_line_score(len(cells_to_clear))
+                self.score += self.compute_line_score(self.board.count_full_line_cells())
             else:
-                # Skip animation when duration is 0 (simulation mode)
+                # Skip animation when duration is 0 (simulation mode): clear the lines in one pass
                 self.lines += line_count
                 self.metrics_manager.lines_cleared += line_count
-                self.score += self.compute_line_score(len(cells_to_clear))
-                self.board.clear_cells(cells_to_clear)
+                self.score += self.compute_line_score(self.board.count_full_line_cells())
+                self.board.clear_full_lines()
         else:
             # No lines to clear, just add 1 point for block placement
             self.score += len(block.cells)
@@ -209,6 +257,7 @@ class GameEngine:
         
         # Remove from preview
         self._preview_blocks.pop(self._selected_preview_index)
+        self._preview_snapshot = None
         
         # Update selected index or reset if none left
         if not self._preview_blocks:
@@ -217,31 +266,51 @@ class GameEngine:
             self._selected_preview_index = min(self._selected_preview_index, len(self._preview_blocks) - 1)
 
         # Check for game over (if no animations in progress or no duration)
-        if not cells_to_clear or self.animation_duration_ms == 0:
+        if not line_count or self.animation_duration_ms == 0:
             self._check_game_over()        
         return True
     
     def update_animations(self) -> None:
         """Update all running animations and clear lines if animations complete."""
-        # If any animations are complete, clear those cells from the board
-        completed = self.animation_manager.update_animations()
-        for animation in completed:
-            if isinstance(animation, FadeoutAnimation):
-                # Clear cells from the board once fadeout is complete
-                self.board.clear_cells(animation.cells)
-                
-                # Check for game over after cells are cleared
-                self._check_game_over()
+        # With animation_duration_ms == 0 nothing is ever queued, so the manager update is skipped.
+        # With animation_duration_ms == 0 nothing is ever queued, so skip the manager entirely.
+        if self.animation_manager.has_animations():
+            completed = self.animation_manager.update_animations()
+            for animation in completed:
+                if isinstance(animation, FadeoutAnimation):
+                    # Clear cells from the board once fadeout is complete
+                    self.board.clear_mask(animation.cell_mask)
+                    self._block_metrics_stale = True
+                    
+                    # Check for game over after cells are cleared
+                    self._check_game_over()
+        
+        # Update game state metrics only when the board or the preview changed since the last frame
+        state_key = (self.board.bits, self.get_preview_blocks())
+        if state_key != self._game_state_key:
+            self._game_state_key = state_key
+            self.metrics_manager.update_game_state_metrics(self.board, self._preview_blocks)
+    
+    def refresh_block_metrics(self) -> None:
+        """Rescan best-fit / game-over metrics only if the board changed since the last scan.
         
-        # Update game state metrics (every frame)
-        self.metrics_manager.update_game_state_metrics(self.board, self._preview_blocks)
+        A tray refill already scans the board it hands blocks out for, so the
+        next caller on the same board can reuse that result.
+        """
+        if self._block_metrics_stale:
+            self.metrics_manager.update_block_metrics(self.board)
+            self._block_metrics_stale = False
+            # Imminent threat reads the opportunity flag, so rescan game state on the next frame
+            self._game_state_key = None
     
     def is_animating(self) -> bool:
         """Check if any animations are currently running."""
-        return self.animation_manager.has_animations()
+        return self.animation_manager.is_animating()
     
     def get_cell_opacity(self, row: int, col: int) -> Optional[float]:
         """Get the opacity (0-1) for a cell if it's being animated."""
+        if not self.animation_manager.has_animations():
+            return None
         return self.animation_manager.get_cell_opacity(row, col)
     
     def find_next_placeable_block(self) -> Optional[int]:
@@ -251,10 +320,8 @@ class GameEngine:
             Index of placeable block or None if no blocks can be placed
         """
         for i, block in enumerate(self._preview_blocks):
-            for r in range(self.board.rows):
-                for c in range(self.board.cols):
-                    if self.board.can_place(block, r, c):
-                        return i
+            if self._has_valid_placement(block):
+                return i
         return None
     
     @property
@@ -266,31 +333,45 @@ class GameEngine:
 
     def _refill_preview(self):
         """Fill the preview with blocks up to the target count."""
-        # Update game state metrics (every frame)
+        # Scan the board the new tray is generated for
         self.metrics_manager.update_block_metrics(self.board)
+        self._block_metrics_stale = False
+        self._game_state_key = None
             
-        try:
-            # Get blocks directly from the enhanced BlockPool
-            new_blocks = self.pool.get_next_blocks(self)
-            
-            # Add new blocks to preview
-            self._preview_blocks.extend(new_blocks)
+        # Get blocks directly from the enhanced BlockPool; errors propagate so the root cause gets fixed
+        new_blocks = self.pool.get_next_blocks(self)
+        
+        # Add new blocks to preview
+        self._preview_blocks.extend(new_blocks)
+        self._preview_snapshot = None
+        
+        # Select first block if none selected
+        if self._selected_preview_index is None and self._preview_blocks:
+            self._selected_preview_index = 0
             
-            # Select first block if none selected
-            if self._selected_preview_index is None and self._preview_blocks:
-                self._selected_preview_index = 0
-                
-            # Check if MetricsManager has update_preview_blocks method before calling
-            if hasattr(self.metrics_manager, 'update_preview_blocks'):
-                self.metrics_manager.update_preview_blocks(
-                    self.board,
-                    self._preview_blocks,
-                    self._selected_preview_index
-                )
-            print(f"[engine/game_engine.py][286] Refilled preview with {len(self._preview_blocks)} blocks")
-        except Exception as e:
-            print(f"[engine/game_engine.py][288] Error in _refill_preview: {e}")
-            # No fallback - if we have errors, we need to know and fix the root cause
+        if self._update_preview_metrics is not None:
+            self._update_preview_metrics(
+                self.board,
+                self._preview_blocks,
+                self._selected_preview_index
+            )
+        logger.debug("Refilled preview with %d blocks", len(self._preview_blocks))
+    
+    def _placement_mask(self, block: Block) -> int:
+        """Get the board's placement mask for a block, memoized per bitboard.
+        
+        Returns:
+            int: Mask of valid anchors, shared by the placement and game-over checks
+        """
+        bits = self.board.bits
+        cached_bits, masks = self._placeable_cache
+        if cached_bits != bits:
+            masks = {}
+            self._placeable_cache = (bits, masks)
+        mask = masks.get(block)
+        if mask is None:
+            mask = masks[block] = self.board.placement_mask(block)
+        return mask
     
     def _has_valid_placement(self, block: Block) -> bool:
         """Check if a block can be placed anywhere on the board.
@@ -298,11 +379,7 @@ class GameEngine:
         Returns:
             True if the block can be placed, False otherwise
         """
-        for r in range(self.board.rows):
-            for c in range(self.board.cols):
-                if self.board.can_place(block, r, c):
-                    return True
-        return False
+        return self._placement_mask(block) != 0
     
     def _check_game_over(self) -> bool:
         """Check if the game is over (no valid moves remain)."""
@@ -317,28 +394,5 @@ class GameEngine:
                 
         # No valid placements for any blocks, game over
         self._game_over = True
-        print(f"[engine/game_engine.py][316] Game over: score: {self.score}, lines: {self.lines}, blocks placed: {self.blocks_placed}")
+        logger.debug("Game over: score: %d, lines: %d, blocks placed: %d", self.score, self.lines, self.blocks_placed)
         return True
-    
-    def _count_lines_from_cells(self, cells: Set[Tuple[int, int]]) -> int:
-        """Count unique lines from a set of cells.
-        
-        Args:
-            cells: Set of (row, col) tuples
-            
-        Returns:
-            int: Number of unique lines (rows + columns)
-        """
-        # Count number of cells per row and per column
-        row_counts: Dict[int, int] = {}
-        col_counts: Dict[int, int] = {}
-        for r, c in cells:
-            row_counts[r] = row_counts.get(r, 0) + 1
-            col_counts[c] = col_counts.get(c, 0) + 1
-
-        # Rows cleared: those rows where the number of cells equals the board columns
-        cleared_rows = sum(1 for r, count in row_counts.items() if count == self.board.cols)
-        # Columns cleared: those columns where the number of cells equals the board rows
-        cleared_cols = sum(1 for c, count in col_counts.items() if count == self.board.rows)
-
-        return cleared_rows + cleared_cols
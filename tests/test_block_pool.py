@@ -0,0 +1,43 @@
+# tests/test_block_pool.py
+import random
+import unittest
+from engine.block_pool import BlockPool
+from engine.shapes import SHAPES
+
+class TestBlockPool(unittest.TestCase):
+    """Test suite for the BlockPool class."""
+
+    def setUp(self):
+        """Create a pool over the default shapes with uniform weights."""
+        self.pool = BlockPool(SHAPES, [1] * len(SHAPES))
+        self.identity = list(range(len(SHAPES)))
+
+    def assert_scratch_is_identity(self):
+        self.assertEqual(self.pool._idx_scratch, self.identity)
+        self.assertEqual(self.pool._idx_pos, self.identity)
+
+    def test_draw_distinct_names_skips_banned_shapes(self):
+        """Draws are distinct, never banned, and leave the scratch permutation untouched."""
+        names = self.pool.shape_names
+        random.seed(7)
+        for _ in range(200):
+            banned = set(random.sample(self.identity, random.randrange(len(names) - 3)))
+            count = random.randint(1, 3)
+            drawn = self.pool._draw_distinct_names(count, banned)
+
+            self.assertEqual(len(drawn), count)
+            self.assertEqual(len(set(drawn)), count)
+            self.assertFalse({names[i] for i in banned} & set(drawn))
+            self.assert_scratch_is_identity()
+
+    def test_draw_distinct_names_caps_count_at_allowed_shapes(self):
+        """Asking for more names than allowed returns each allowed name once."""
+        names = self.pool.shape_names
+        banned = set(range(2, len(names)))
+        drawn = self.pool._draw_distinct_names(5, banned)
+
+        self.assertCountEqual(drawn, names[:2])
+        self.assert_scratch_is_identity()
+
+if __name__ == "__main__":
+    unittest.main()
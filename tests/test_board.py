@@ -0,0 +1,158 @@
+# tests/test_board.py
+import unittest
+from engine.board import Board
+from engine.block import Block
+from engine.shapes import SHAPES
+
+class TestBoard(unittest.TestCase):
+    """Test suite for the Board class."""
+
+    def test_counts_follow_grid_assignment(self):
+        """Assigning a grid rebuilds the row and column fill counts."""
+        board = Board(8, 8)
+        board.grid = [[1, 1, 1, 1, 1, 1, 1, 1],
+                      [1, 0, 0, 0, 0, 0, 0, 0],
+                      [1, 0, 0, 0, 0, 0, 0, 0],
+                      [1, 0, 0, 0, 0, 0, 0, 0],
+                      [1, 0, 0, 0, 0, 0, 0, 0],
+                      [1, 0, 0, 0, 0, 0, 0, 0],
+                      [1, 0, 0, 0, 0, 0, 0, 0],
+                      [1, 0, 0, 0, 0, 0, 0, 0]]
+        self.assertEqual(board.row_counts, [8, 1, 1, 1, 1, 1, 1, 1])
+        self.assertEqual(board.col_counts, [8, 1, 1, 1, 1, 1, 1, 1])
+
+    def test_place_and_clear_row_and_column(self):
+        """Completing a row and a column clears both and keeps counts in sync."""
+        board = Board(8, 8)
+        for c in range(1, 8):
+            board.place_block(Block(SHAPES["1x1-square"]), 0, c)
+        for r in range(1, 8):
+            board.place_block(Block(SHAPES["1x1-square"]), r, 0)
+        self.assertEqual(board.clear_full_lines(), 0)
+
+        board.place_block(Block(SHAPES["1x1-square"]), 0, 0)
+        self.assertEqual(len(board.find_full_lines()), 15)
+        self.assertEqual(board.count_full_lines(), 2)
+        self.assertEqual(board.count_full_line_cells(), 15)
+        self.assertEqual(board.clear_full_lines(), 2)
+
+        self.assertTrue(all(cell == 0 for row in board.grid for cell in row))
+        self.assertEqual(board.row_counts, [0] * 8)
+        self.assertEqual(board.col_counts, [0] * 8)
+
+    def test_can_place_bounds(self):
+        """Blocks cannot hang off the board or overlap filled cells."""
+        board = Board(8, 8)
+        block = Block(SHAPES["2x3-rect"])
+        self.assertTrue(board.can_place(block, 6, 5))
+        self.assertFalse(board.can_place(block, 7, 5))
+        self.assertFalse(board.can_place(block, 6, 6))
+        self.assertFalse(board.can_place(block, -1, 0))
+
+        board.place_block(Block(SHAPES["1x1-square"]), 7, 7)
+        self.assertFalse(board.can_place(block, 6, 5))
+        self.assertTrue(board.can_place(block, 5, 5))
+
+    def test_copy_and_assignment_keep_bitboard(self):
+        """Placement checks follow assigned grids, and copies do not share state."""
+        board = Board(8, 8)
+        board.grid = [[1 if c == 3 else 0 for c in range(8)] for _ in range(8)]
+        block = Block(SHAPES["1x4-line"])
+        self.assertFalse(board.can_place(block, 0, 0))
+        self.assertTrue(board.can_place(block, 0, 4))
+
+        copy = board.copy()
+        copy.place_block(block, 0, 4)
+        self.assertFalse(copy.can_place(block, 0, 4))
+        self.assertTrue(board.can_place(block, 0, 4))
+        self.assertEqual(board.row_counts[0], 1)
+
+    def test_grid_cell_writes_keep_bitboard(self):
+        """Writing cells through grid[r][c] keeps counts and placement checks in sync."""
+        board = Board(8, 8)
+        square = Block(SHAPES["1x1-square"])
+        board.grid[2][3] = 1
+        board.grid[2][3] = 1
+        self.assertFalse(board.can_place(square, 2, 3))
+        self.assertEqual(board.row_counts[2], 1)
+        self.assertEqual(board.col_counts[3], 1)
+
+        board.grid[7][:] = bytes([1] * 8)
+        self.assertEqual(board.count_full_lines(), 1)
+        self.assertEqual(board.bits, Board.from_grid(board.grid).bits)
+
+        board.grid[2][3] = 0
+        self.assertTrue(board.can_place(square, 2, 3))
+        self.assertEqual(board.col_counts[3], 1)
+
+    def test_placement_mask_matches_can_place(self):
+        """The anchor mask marks exactly the positions can_place accepts."""
+        board = Board(8, 8)
+        board.grid = [[(r * 3 + c * 5) % 7 == 0 for c in range(8)] for r in range(8)]
+        for name, cells in SHAPES.items():
+            block = Block(cells)
+            mask = board.placement_mask(block)
+            for r in range(8):
+                for c in range(8):
+                    self.assertEqual(bool(mask >> (r * 8 + c) & 1), board.can_place(block, r, c), name)
+
+    def test_lines_cleared_by_matches_clear_full_lines(self):
+        """Counting lines on the bitboard agrees with placing and clearing."""
+        board = Board(8, 8)
+        board.grid = [[1, 1, 1, 1, 1, 0, 0, 1],
+                      [0, 0, 0, 0, 0, 0, 0, 1],
+                      [0, 0, 0, 0, 0, 0, 0, 1],
+                      [0, 0, 0, 0, 0, 0, 0, 1],
+                      [0, 0, 0, 0, 0, 0, 0, 1],
+                      [0, 0, 0, 0, 0, 0, 0, 1],
+                      [1, 1, 1, 1, 1, 1, 1, 0],
+                      [0, 0, 0, 0, 0, 0, 0, 1]]
+        block = Block(SHAPES["1x2-line"])
+        self.assertEqual(board.lines_cleared_by(block, 0, 5), 1)
+        self.assertEqual(board.lines_cleared_by(Block(SHAPES["1x1-square"]), 6, 7), 2)
+
+        self.assertEqual(board.cells_cleared_by(Block(SHAPES["1x1-square"]), 6, 7), 15)
+
+        copy = board.copy()
+        copy.place_block(Block(SHAPES["1x1-square"]), 6, 7)
+        self.assertEqual(copy.clear_full_lines(), 2)
+
+    def test_lines_cleared_by_on_non_square_board(self):
+        """Line detection on the bitboard does not assume 8 columns or a square board."""
+        board = Board(3, 5)
+        board.grid = [[1, 1, 1, 1, 0],
+                      [0, 0, 0, 0, 1],
+                      [1, 0, 1, 1, 1]]
+        square = Block(SHAPES["1x1-square"])
+        self.assertEqual(board.lines_cleared_by(square, 0, 4), 2)
+        self.assertEqual(board.cells_cleared_by(square, 0, 4), 7)
+        self.assertEqual(board.lines_cleared_by(square, 1, 0), 1)
+        self.assertEqual(board.cells_cleared_by(square, 1, 0), 3)
+
+    def test_full_line_mask_and_clear_mask(self):
+        """The packed full-line mask clears the same cells as find_full_lines."""
+        board = Board(8, 8)
+        board.grid = [[1] * 8] + [[1, 0, 0, 0, 0, 0, 0, 0] for _ in range(7)]
+        mask = board.full_line_mask()
+        self.assertEqual({divmod(bit, 8) for bit in range(64) if mask >> bit & 1}, board.find_full_lines())
+
+        board.clear_mask(mask)
+        self.assertTrue(all(cell == 0 for row in board.grid for cell in row))
+        self.assertEqual(board.row_counts, [0] * 8)
+        self.assertEqual(board.col_counts, [0] * 8)
+        self.assertTrue(board.can_place(Block(SHAPES["1x1-square"]), 0, 0))
+
+    def test_snapshot_follows_board_changes(self):
+        """Snapshots are reused while the board is unchanged and rebuilt after a move."""
+        board = Board(8, 8)
+        first = board.snapshot()
+        self.assertIs(board.snapshot(), first)
+
+        board.place_block(Block(SHAPES["1x1-square"]), 2, 3)
+        second = board.snapshot()
+        self.assertIsNot(second, first)
+        self.assertEqual(second[2][3], 1)
+        self.assertEqual(first[2][3], 0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+# tests/test_game_engine.py
+import copy
+import unittest
+from unittest import mock
+from config.defaults import CONFIG
+from engine.block import shared_block
+from engine.game_engine import GameEngine
+from engine.shapes import SHAPES
+
+class _SquarePool:
+    """BlockPool stand-in that deals a tray of 1x1 squares."""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def get_next_blocks(self, engine_state, count=3):
+        return [shared_block(SHAPES["1x1-square"])] * count
+
+class TestGameEngine(unittest.TestCase):
+    """Test suite for the GameEngine class."""
+
+    def test_imminent_threat_follows_block_metrics_rescan(self):
+        """A block metrics rescan on an unchanged board refreshes the imminent threat flag."""
+        with mock.patch("engine.game_engine.BlockPool", _SquarePool):
+            engine = GameEngine(copy.deepcopy(CONFIG))
+        engine.animation_duration_ms = 0
+        # Sparse anti-diagonals: no 5-long line fits, but single cells fit easily
+        engine.board.grid = [[1 if (r + c) % 5 == 4 else 0 for c in range(8)] for r in range(8)]
+        engine.select_preview_block(0)
+        self.assertTrue(engine.place_selected_block(0, 0))
+
+        # The opportunity flag still describes the board the tray was dealt on
+        engine.update_animations()
+        self.assertFalse(engine.metrics_manager.imminent_threat)
+
+        engine.refresh_block_metrics()
+        self.assertTrue(engine.metrics_manager.opportunity)
+        engine.update_animations()
+        self.assertTrue(engine.metrics_manager.imminent_threat)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,5 @@
 # ui/animation.py
-from typing import List, Tuple, Dict, Set, Optional
+from typing import List, Dict, Optional
 import time
 
 class Animation:
@@ -54,9 +54,14 @@ class Animation:
 
 class FadeoutAnimation(Animation):
     """Animation for fading out cleared lines"""
-    def __init__(self, cells: Set[Tuple[int, int]], duration_ms: int = 500):
+    def __init__(self, cell_mask: int, cols: int, duration_ms: int = 500):
         super().__init__(duration_ms)
-        self.cells = cells  # Set of (row, col) coordinates to animate
+        self.cell_mask = cell_mask  # Bit (row * cols + col) set for every cell to animate
+        self.cols = cols
+    
+    def covers(self, row: int, col: int) -> bool:
+        """Check whether the cell at (row, col) is part of this animation"""
+        return (self.cell_mask >> (row * self.cols + col)) & 1 == 1
     
     def get_opacity(self) -> float:
         """Get current opacity value (1.0 to 0.0)"""
@@ -120,6 +125,6 @@ class AnimationManager:
             float: Opacity value or None if cell is not animating
         """
         for anim in self.animations:
-            if isinstance(anim, FadeoutAnimation) and (row, col) in anim.cells:
+            if isinstance(anim, FadeoutAnimation) and anim.covers(row, col):
                 return anim.get_opacity()
         return None 
\ No newline at end of file
@@ -17,6 +17,8 @@ class BoardView:
             self.board_cells * cell_size,
             self.board_cells * cell_size
         )
+        # Scratch surface for fading cells; fill() overwrites every pixel, so it can be reused
+        self._fade_surface = pygame.Surface((cell_size, cell_size), pygame.SRCALPHA)
     
     def draw(self, surface, engine):
         
@@ -72,13 +74,17 @@ class BoardView:
             color: RGB color tuple
             opacity: Opacity value from 0.0 to 1.0
         """
-        # Create a transparent surface for the cell
-        cell_surface = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-        
-        # Calculate the color with opacity
+        # Calculate the color with opacity; a fully transparent cell draws nothing
         opacity_int = max(0, min(255, int(opacity * 255)))
+        if opacity_int == 0:
+            return
         transparent_color = (*color, opacity_int)  # RGBA
         
+        # Reuse the scratch surface when the cell size matches it
+        cell_surface = self._fade_surface
+        if cell_surface.get_size() != (rect.width, rect.height):
+            cell_surface = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
+        
         # Fill the temporary surface and draw border
         cell_surface.fill(transparent_color)
         pygame.draw.rect(cell_surface, (*CELL_BORDER, opacity_int), 
@@ -1,5 +1,6 @@
 # ui/views/overlay_view.py
 import pygame
+from collections import OrderedDict
 from ui.colours import BG_COLOR, OVERLAY, GREEN
 from ui.font_manager import font_manager
 
@@ -26,9 +27,38 @@ class OverlayView:
         self.simulation_outline_color = (0, 0, 139)  # Dark blue
         self.stats_outline_color = (0, 0, 0)  # Black
         self.outline_thickness = 2
+        
+        # Surfaces reused across frames while an overlay stays on screen
+        self._overlay_surface = None
+        # LRU of outlined text surfaces; one overlay draws at most 5 strings, so 16 entries
+        # keep both overlays warm while old per-game stat lines age out
+        self._outlined_text_cache = OrderedDict()
+        self._outlined_text_cache_size = 16
+    
+    def _get_overlay_surface(self):
+        """Return the translucent full-window overlay, rebuilt only when the size changes"""
+        size = (self.window_size[0], self.window_size[1])
+        if self._overlay_surface is None or self._overlay_surface.get_size() != size:
+            self._overlay_surface = pygame.Surface(size, pygame.SRCALPHA)
+            self._overlay_surface.fill(OVERLAY)
+        return self._overlay_surface
     
     def _render_text_with_outline(self, font, text, color, outline_color, outline_width):
-        """Helper method to render text with outline"""
+        """Helper method to render text with outline (cached, the same text is drawn every frame)"""
+        # Keyed on the font object itself: the cache holds a reference, so it cannot be recycled
+        cache = self._outlined_text_cache
+        key = (font, text, color, outline_color, outline_width)
+        cached = cache.get(key)
+        if cached is None:
+            cached = cache[key] = self._build_text_with_outline(font, text, color, outline_color, outline_width)
+            if len(cache) > self._outlined_text_cache_size:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return cached
+    
+    def _build_text_with_outline(self, font, text, color, outline_color, outline_width):
+        """Render text with outline onto a new surface"""
         # Render the outline by rendering the text multiple times with offsets
         text_surface = font.render(text, True, outline_color)
         outlined_surface = pygame.Surface(
@@ -50,10 +80,8 @@ class OverlayView:
         return outlined_surface
     
     def draw_game_over(self, surface, engine=None):
-        # Create overlay surface
-        overlay = pygame.Surface((self.window_size[0], self.window_size[1]), pygame.SRCALPHA)
-        overlay.fill(OVERLAY)
-        surface.blit(overlay, (0, 0))
+        # Dim the game with the cached overlay surface
+        surface.blit(self._get_overlay_surface(), (0, 0))
         
         # Draw game over text with crimson outline
         game_over_text = self._render_text_with_outline(
@@ -115,10 +143,8 @@ class OverlayView:
     
     def draw_simulation_over(self, surface, simulation_stats=None):
         """Draw the simulation over screen with batch run statistics."""
-        # Create overlay surface
-        overlay = pygame.Surface((self.window_size[0], self.window_size[1]), pygame.SRCALPHA)
-        overlay.fill(OVERLAY)
-        surface.blit(overlay, (0, 0))
+        # Dim the game with the cached overlay surface
+        surface.blit(self._get_overlay_surface(), (0, 0))
         
         # Draw simulation over text with dark blue outline
         sim_over_text = self._render_text_with_outline(
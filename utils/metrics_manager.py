@@ -1,8 +1,9 @@
 # utils/metrics_manager.py
+import sys
 from typing import Dict, List, Set, Tuple, Optional
 from collections import deque
 from engine.board import Board
-from engine.block import Block
+from engine.block import Block, shared_block
 from typing import Dict, List, Tuple
 
 class MetricsManager:
@@ -34,6 +35,11 @@ class MetricsManager:
         self.game_over_blocks = []
         self.num_game_over_blocks = 0
 
+        # Shape table cache, rebuilt only when a different shapes dict is passed in
+        self._shapes_source = None
+        self._sorted_shapes: Tuple[Tuple[str, Block], ...] = ()
+        self._shape_blocks: Dict[str, Block] = {}
+
 
         # Initialize game state metrics
         self.imminent_threat = False
@@ -64,7 +70,8 @@ class MetricsManager:
             preview_blocks: List of preview blocks
         """
         # Calculate occupancy ratio
-        filled_cells = sum(sum(row) for row in board.grid)
+        # Rows are bytearrays, so each row sum runs in C
+        filled_cells = sum(map(sum, board.grid))
         total_cells = board.rows * board.cols
         self.occupancy_ratio = filled_cells / total_cells
 
@@ -96,22 +103,40 @@ class MetricsManager:
         self, board: Board
     ) -> None:
 
-        # Calculate best fit block and position
         shapes = self.config["shapes"]
+        self._ensure_shape_cache(shapes)
+
+        # Calculate best fit block and position; the same shape scan collects the game over blocks
+        game_over_blocks = []
         self.best_fit_block, self.best_fit_position, self.clearable_lines = self._compute_best_fit(
-            shapes, board
+            shapes, board, game_over_blocks
         )
 
-        # Check for game over blocks and opportunity
-        self.opportunity, self.game_over_blocks = self._find_game_over_blocks(
-            shapes, board
-        )
+        # Opportunity exists when some shape cannot be placed anywhere
+        self.opportunity = bool(game_over_blocks)
+        self.game_over_blocks = game_over_blocks or ["None"]
         self.num_game_over_blocks = len(self.game_over_blocks)
 
+    def _ensure_shape_cache(self, shapes: Dict[str, List[Tuple[int, int]]]) -> None:
+        """Build the sorted (name, Block) table once per shapes dict.
+
+        Args:
+            shapes: Mapping of shape names ➜ list of (row, col) offsets.
+        """
+        if shapes is self._shapes_source:
+            return
+        # Interned names so the reported best-fit / game-over names compare by identity
+        self._shape_blocks = {sys.intern(name): shared_block(cells) for name, cells in shapes.items()}
+        self._sorted_shapes = tuple(
+            (name, self._shape_blocks[name]) for name in sorted(self._shape_blocks)
+        )
+        self._shapes_source = shapes
+
     def _compute_best_fit(
         self,
         shapes: Dict[str, List[Tuple[int, int]]],
         board: Board,
+        unplaceable: Optional[List[str]] = None,
     ) -> Tuple[str, Tuple[int, int], int]:
         """
         Pick the shape and placement that clears the most *distinct* lines.
@@ -119,6 +144,9 @@ class MetricsManager:
         Args:
             shapes: Mapping of shape names ➜ list of (row, col) offsets.
             board:  Current board state *before* the drop.
+            unplaceable: Optional list that receives, in sorted order, the names
+                of shapes with no legal anchor (the game-over blocks), so one
+                pass over the shapes serves both metrics.
 
         Returns:
             (shape_name, (top_row, left_col), lines_cleared)
@@ -132,53 +160,48 @@ class MetricsManager:
         fallback_pos: Tuple[int, int] = (-1, -1)
 
         # Pre-compute helpers.
-        board_rows: int = board.rows
-        board_cols: int = board.cols
-        centre_x: float = (board_cols - 1) / 2  # fractional centre column
-
-        for shape_name in sorted(shapes):  # deterministic iteration
-            block = Block(shapes[shape_name])
-
-            for top in range(board_rows - block.height + 1):
-                for left in range(board_cols - block.width + 1):
-                    if not board.can_place(block, top, left):
-                        continue
+        centre_x: float = (board.cols - 1) / 2  # fractional centre column
+
+        self._ensure_shape_cache(shapes)
+        for shape_name, block in self._sorted_shapes:  # deterministic iteration
+
+            # Every legal anchor in row-major order, straight from the bitboard
+            anchors = board.valid_anchors(block)
+            if not anchors and unplaceable is not None:
+                unplaceable.append(shape_name)
+            for top, left in anchors:
+                # Record first valid placement as fallback
+                if fallback_shape == "None":
+                    fallback_shape = shape_name
+                    fallback_pos = (top, left)
+
+                # Count the rows+cols the drop would clear straight from the bitboard
+                lines_cleared = board.lines_cleared_by(block, top, left)
+                # Cap to theoretical maximum
+                if lines_cleared > 6:
+                    raise ValueError(f"Invalid line count: {lines_cleared} for shape {shape_name} at ({top}, {left})")
+
+                # ---------- Choose the better candidate -------------------------
+                if lines_cleared > best_lines:
+                    best_shape = shape_name
+                    best_pos = (top, left)
+                    best_lines = lines_cleared
+                    continue
 
-                    # Record first valid placement as fallback
-                    if fallback_shape == "None":
-                        fallback_shape = shape_name
-                        fallback_pos = (top, left)
-
-                    # Simulate placement and count cleared lines via clear_full_lines
-                    temp = Board.from_grid(board.grid)
-                    temp.place_block(block, top, left)
-                    # Board.clear_full_lines returns rows+cols cleared
-                    lines_cleared = temp.clear_full_lines()
-                    # Cap to theoretical maximum
-                    if lines_cleared > 6:
-                        raise ValueError(f"Invalid line count: {lines_cleared} for shape {shape_name} at ({top}, {left})")
-
-                    # ---------- Choose the better candidate -------------------------
-                    if lines_cleared > best_lines:
+                if lines_cleared == best_lines and lines_cleared > 0:
+                    # Lower `top` = piece lands earlier (gravity tie-break).
+                    current_centre_dist = abs((left + block.width / 2) - centre_x)
+                    best_block = self._shape_blocks[best_shape]
+                    best_centre_dist = abs(
+                        (best_pos[1] + best_block.width / 2) - centre_x
+                    )
+
+                    if top < best_pos[0] or (
+                        top == best_pos[0] and current_centre_dist < best_centre_dist
+                    ):
                         best_shape = shape_name
                         best_pos = (top, left)
-                        best_lines = lines_cleared
-                        continue
-
-                    if lines_cleared == best_lines and lines_cleared > 0:
-                        # Lower `top` = piece lands earlier (gravity tie-break).
-                        current_centre_dist = abs((left + block.width / 2) - centre_x)
-                        best_block = Block(shapes[best_shape])
-                        best_centre_dist = abs(
-                            (best_pos[1] + best_block.width / 2) - centre_x
-                        )
-
-                        if top < best_pos[0] or (
-                            top == best_pos[0] and current_centre_dist < best_centre_dist
-                        ):
-                            best_shape = shape_name
-                            best_pos = (top, left)
-                    # ----------------------------------------------------------------
+                # ----------------------------------------------------------------
 
         # If no clear improvement found, fallback to first valid placement
         if best_lines == 0:
@@ -196,11 +219,7 @@ class MetricsManager:
         Returns:
             True if block can be placed somewhere on the board
         """
-        for r in range(board.rows):
-            for c in range(board.cols):
-                if board.can_place(block, r, c):
-                    return True
-        return False
+        return board.placement_mask(block) != 0
 
     def _find_valid_placements(
         self, board: Board, block: Block
@@ -216,16 +235,19 @@ class MetricsManager:
         """
         placements = []
 
-        for r in range(board.rows):
-            for c in range(board.cols):
-                if board.can_place(block, r, c):
-                    # Simulate placement
-                    temp_board = Board.from_grid(board.grid)
-                    temp_board.place_block(block, r, c)
-                    cleared = temp_board.find_full_lines()
-                    lines = self._count_lines(cleared)
+        # One scratch board, with each simulated placement taken back out afterwards
+        temp_board = board.copy()
+        cols = board.cols
+        block_mask = block.mask(cols)
 
-                    placements.append((r, c, lines))
+        # Anchors inside the block's bounding-box range that are also free
+        for r, c in board.valid_anchors(block):
+            # Simulate placement
+            temp_board.place_block(block, r, c)
+            lines = self._count_lines(temp_board.full_line_mask(), cols)
+            temp_board.clear_mask(block_mask << (r * cols + c))
+
+            placements.append((r, c, lines))
 
         return placements
 
@@ -244,42 +266,12 @@ class MetricsManager:
         """
         r, c = position
         board.place_block(block, r, c)
-        cleared = board.find_full_lines()
+        cleared = board.full_line_mask()
         if cleared:
-            board.clear_cells(cleared)
-            return self._count_lines(cleared)
+            board.clear_mask(cleared)
+            return self._count_lines(cleared, board.cols)
         return 0
 
-    def _find_game_over_blocks(
-        self,
-        shapes: Dict[str, List[Tuple[int, int]]],
-        board: Board
-    ) -> Tuple[bool, List[str]]:
-        """Find blocks that cannot be placed now and won't fit after placing preview blocks.
-
-        Args:
-            shapes: Dictionary of all possible block shapes
-            board: Current game board
-
-        Returns:
-            Tuple of (opportunity_exists, list_of_block_names)
-        """
-
-        # Process shape names in consistent order for testing
-        game_over_blocks = []
-
-        # Check from all possible shapes if any of them can not be placed on the board
-        for shape_name in sorted(shapes.keys()):
-            block = Block(shapes[shape_name])
-            if not self._can_place_anywhere(board, block):
-                game_over_blocks.append(shape_name)
-
-        # Return all game over blocks found
-        return (
-            bool(game_over_blocks),
-            game_over_blocks if game_over_blocks else ["None"],
-        )
-
     def _find_empty_clusters(self, board: Board) -> List[Set[Tuple[int, int]]]:
         """Find clusters of connected empty cells using BFS.
 
@@ -295,12 +287,13 @@ class MetricsManager:
 
         # Offsets for 4-directional neighbors
         offsets = [(0, 1), (1, 0), (0, -1), (-1, 0)]
+        grid, rows, cols = board.grid, board.rows, board.cols
 
         # Iterate through all cells
-        for r in range(board.rows):
-            for c in range(board.cols):
+        for r in range(rows):
+            for c in range(cols):
                 # Skip if cell is filled or already visited
-                if board.grid[r][c] or (r, c) in visited:
+                if grid[r][c] or (r, c) in visited:
                     continue
 
                 # Start a new cluster
@@ -321,9 +314,9 @@ class MetricsManager:
                     for dr, dc in offsets:
                         next_r, next_c = curr_r + dr, curr_c + dc
                         if (
-                            0 <= next_r < board.rows
-                            and 0 <= next_c < board.cols
-                            and not board.grid[next_r][next_c]
+                            0 <= next_r < rows
+                            and 0 <= next_c < cols
+                            and not grid[next_r][next_c]
                             and (next_r, next_c) not in visited
                         ):
                             queue.append((next_r, next_c))
@@ -394,23 +387,30 @@ class MetricsManager:
         else:
             self.phase = "early"
 
-    def _count_lines(self, cells: Set[Tuple[int, int]]) -> int:
-        """Count number of distinct rows and columns in the cleared set.
+    def _count_lines(self, cells: int, cols: int) -> int:
+        """Count number of distinct rows and columns in the cleared cells.
 
         Args:
-            cells: Set of (row, col) coordinates to count
+            cells: Bitmask of cleared cells (bit ``r * cols + c``, see Board.full_line_mask)
+            cols: Width of the board the mask was built on
 
         Returns:
-            Number of distinct rows and columns in the set
+            Number of distinct rows and columns in the mask
         """
-        rows = set()
-        cols = set()
-
-        for r, c in cells:
-            rows.add(r)
-            cols.add(c)
-
-        return len(rows) + len(cols)
+        # Walk the mask one row slice at a time; OR-ing the slices marks the touched columns
+        row_mask = (1 << cols) - 1
+        rows_touched = 0
+        col_bits = 0
+
+        while cells:
+            row = cells & row_mask
+            if row:
+                rows_touched += 1
+                col_bits |= row
+            cells >>= cols
+
+        # bin().count rather than int.bit_count, which needs Python 3.10
+        return rows_touched + bin(col_bits).count("1")
 
     def get_all_metrics(self) -> Dict:
         """Get all metrics as a dictionary for display."""